@@ -16,16 +16,26 @@ Guardian AI – Fully Autonomous Recursive AI with Emotion, Perception & Dream S
 
 import os
 import time
+import asyncio
+import atexit
+import re
 import json
-import random
+import sqlite3
+import urllib.parse
 import numpy as np
 import psutil
 import requests
+import lxml.html
 import subprocess
 import threading
+import traceback
+import multiprocessing
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import shared_memory
 from datetime import datetime
-from typing import Any, Dict, List
-from bs4 import BeautifulSoup
+from typing import Any, Deque, Dict, Optional
+from requests.adapters import HTTPAdapter
 
 # Optional Dependencies
 try:
@@ -50,8 +60,6 @@ except ImportError:
 try:
     import pyttsx3
     VOICE_AVAILABLE = True
-    voice_engine = pyttsx3.init()
-    voice_engine.setProperty('rate', 160)
 except ImportError:
     VOICE_AVAILABLE = False
 
@@ -61,23 +69,231 @@ try:
 except ImportError:
     IMAGE_GENERATION_AVAILABLE = False
 
-class GuardianAI:
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Kernel sources for low-syscall resource sampling (Linux only)
+PROC_STAT = "/proc/stat"
+PROC_MEMINFO = "/proc/meminfo"
+PROC_BUFFER_SIZE = 8192
+CPU_MIN_WINDOW = 1.0  # seconds; shorter CPU deltas are too noisy to act on
+
+# Optional packages self_repair can install, keyed by pip name -> importable
+REPAIRABLE_PACKAGES = {
+    "opencv-python": OPENCV_AVAILABLE,
+    "pyaudio": PYAUDIO_AVAILABLE,
+    "selenium": SELENIUM_AVAILABLE,
+    "pyttsx3": VOICE_AVAILABLE
+}
+INSTALL_LOCK_FILE = os.path.expanduser("~/.guardian_install.lock")
+
+# Persistence & bounded histories
+MEMORY_DIR = "ai_memory"
+STATE_FILE = os.path.join(MEMORY_DIR, "state.json")
+RESOURCE_HISTORY_FILE = os.path.join(MEMORY_DIR, "resource_history.npy")
+MEMORY_LIMIT = 1000
+DREAM_JOURNAL_LIMIT = 256
+RESOURCE_WINDOW = 1024
+RESOURCE_DTYPE = np.dtype([("ram", "f4"), ("cpu", "f4"), ("battery", "f4"), ("ts", "f8")])
+
+# Wikipedia learning
+WIKI_URL = "https://en.wikipedia.org/wiki/{}"
+WIKI_USER_AGENT = "GuardianAI/1.0 (https://github.com/ddaann117/GuardianAI)"
+WIKI_CACHE_FILE = os.path.join(MEMORY_DIR, "wiki_cache.db")
+WIKI_CACHE_TTL = 7 * 24 * 3600  # seconds
+WIKI_SUMMARY_XPATH = '(//div[@id="mw-content-text"]//p)[position() <= 5]'
+
+# Fixed emotion order for the array-backed emotional state
+EMOTION_KEYS = ("happiness", "curiosity", "stress", "anxiety", "confidence", "frustration")
+EMOTION_INDEX = {key: i for i, key in enumerate(EMOTION_KEYS)}
+EMOTION_DECAY_RATE = 0.001  # per second
+
+# Background cycle cadence
+THOUGHT_INTERVAL = 5  # seconds between background cycles
+SLOW_CYCLE_THRESHOLD = 2.0  # seconds; a slower cycle skips the next vision pass
+
+# Microphone sampling
+AUDIO_RATE = 44100
+AUDIO_CHUNK = 1024
+SILENCE_THRESHOLD = 500  # peak int16 amplitude treated as silence
+
+# Camera motion detection
+MOTION_FRAME_SIZE = (32, 32)
+MOTION_THRESHOLD = 8.0  # mean absolute grayscale difference between samples
+MOTION_CHECK_EVERY = 2  # decode one grabbed frame out of every N
+CAMERA_QUEUE_DEPTH = 4  # V4L2 default; drained per tick if the backend ignores BUFFERSIZE
+
+# Optional sensor process: shared int64 block [sequence, visual_activity, audio_detected]
+SENSOR_SLOTS = 3
+SENSOR_NO_READING = -1
+SENSOR_READ_RETRIES = 3
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True, nogil=True)
+    def _decay_and_clamp(emotions, dt, rate):
+        """Decays every emotion by rate * dt in place and keeps it within 0 to 1."""
+        for i in range(emotions.shape[0]):
+            value = emotions[i] - rate * dt
+            emotions[i] = 0.0 if value < 0.0 else (1.0 if value > 1.0 else value)
+else:
+    def _decay_and_clamp(emotions, dt, rate):
+        """Decays every emotion by rate * dt in place and keeps it within 0 to 1."""
+        np.clip(emotions - rate * dt, 0.0, 1.0, out=emotions)
+
+def _atomic_write(path: str, write):
+    """Writes via a temp file and os.replace so a crash never truncates the target."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+class SensoryDevices:
+    """Persistent camera & microphone handles with cheap per-tick readings."""
+
     def __init__(self):
-        self.memory: List[str] = []
+        # Keep the camera open; ticks only grab and occasionally decode a frame
+        self._cap_lock = threading.Lock()
+        self._stale_grabs = 0  # extra grabs per tick, set by _open_camera
+        self._cap = self._open_camera() if OPENCV_AVAILABLE else None
+        self._frames_grabbed = 0
+        self._prev_frame = None
+
+        # Keep the microphone stream open instead of reopening it every cycle
+        self._audio = None
+        self._audio_stream = self._open_audio_stream() if PYAUDIO_AVAILABLE else None
+        self._silent_chunk = bytes(AUDIO_CHUNK * 2)  # one all-zero int16 read
+
+    def read_motion(self) -> Optional[bool]:
+        """Returns whether the camera sees motion, or None when there is no new reading."""
+        if self._cap is None:
+            return None
+
+        frame = None
+        with self._cap_lock:
+            # Ticks are seconds apart, so skip frames the driver queued in the meantime
+            grabbed = self._cap is not None
+            for _ in range(1 + self._stale_grabs):
+                grabbed = grabbed and self._cap.grab()
+            if grabbed:
+                self._frames_grabbed += 1
+                if self._frames_grabbed % MOTION_CHECK_EVERY == 0:
+                    _, frame = self._cap.retrieve()
+
+        if not grabbed:
+            return False
+        if frame is None:
+            return None
+
+        # Compare a tiny grayscale thumbnail against the previous sample
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        thumb = cv2.resize(gray, MOTION_FRAME_SIZE, interpolation=cv2.INTER_AREA).astype(np.int16)
+        moving = self._prev_frame is not None and np.abs(thumb - self._prev_frame).mean() > MOTION_THRESHOLD
+        self._prev_frame = thumb
+        return bool(moving)
+
+    def read_audio(self) -> Optional[bool]:
+        """Returns whether the microphone hears sound, or None without a microphone."""
+        if self._audio_stream is None:
+            return None
+
+        # Ticks are seconds apart: drop everything buffered except the newest chunk
+        stale_frames = self._audio_stream.get_read_available() - AUDIO_CHUNK
+        if stale_frames > 0:
+            self._audio_stream.read(stale_frames, exception_on_overflow=False)
+        audio_data = self._audio_stream.read(AUDIO_CHUNK, exception_on_overflow=False)
+        if audio_data == self._silent_chunk:
+            # Digital silence (e.g. a muted mic) is settled by one memcmp
+            return False
+
+        samples = np.frombuffer(audio_data, dtype=np.int16)
+        peak = np.abs(samples, dtype=np.int32).max() if samples.size else 0
+        return bool(peak > SILENCE_THRESHOLD)
+
+    def _open_camera(self):
+        """Opens the default camera once, or returns None if it is unavailable."""
+        cap = cv2.VideoCapture(0)
+        if not cap.isOpened():
+            cap.release()
+            return None
+        if not cap.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+            self._stale_grabs = CAMERA_QUEUE_DEPTH
+        atexit.register(self._release_camera)
+        return cap
+
+    def _release_camera(self):
+        """Releases the camera without racing an in-flight grab."""
+        with self._cap_lock:
+            if self._cap is not None:
+                self._cap.release()
+                self._cap = None
+
+    def _open_audio_stream(self):
+        """Opens a persistent input stream, or returns None if no device is usable."""
+        try:
+            self._audio = pyaudio.PyAudio()
+            atexit.register(self._audio.terminate)
+            return self._audio.open(format=pyaudio.paInt16, channels=1, rate=AUDIO_RATE,
+                                    input=True, frames_per_buffer=AUDIO_CHUNK)
+        except OSError:
+            return None
+
+def _sensor_worker(shm_name: str):
+    """Sensor process loop: publishes readings into shared memory under a seqlock."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    block = np.ndarray((SENSOR_SLOTS,), dtype=np.int64, buffer=shm.buf)
+    senses = SensoryDevices()
+    readers = (senses.read_motion, senses.read_audio)
+    last_errors: Dict[str, Optional[str]] = {}
+    while True:
+        # A failing device must not kill the loop; publish "no reading" and report
+        # each new error once, like the in-process background loop does
+        readings = []
+        for reader in readers:
+            try:
+                readings.append(reader())
+                last_errors[reader.__name__] = None
+            except Exception as e:
+                if repr(e) != last_errors.get(reader.__name__):
+                    print(f"⚠️ Sensor process {reader.__name__} failed:")
+                    traceback.print_exception(e)
+                last_errors[reader.__name__] = repr(e)
+                readings.append(None)
+        moving, detected = readings
+
+        block[0] += 1  # odd sequence: update in progress
+        block[1] = SENSOR_NO_READING if moving is None else int(moving)
+        block[2] = SENSOR_NO_READING if detected is None else int(detected)
+        block[0] += 1
+        time.sleep(THOUGHT_INTERVAL)
+
+class GuardianAI:
+    def __init__(self, sensor_process: bool = False):
+        self.memory: Deque[str] = deque(maxlen=MEMORY_LIMIT)
         self.knowledge_base: Dict[str, Any] = {}
+        self.dream_journal: "OrderedDict[int, str]" = OrderedDict()
+        self.dream_count = 0
+        self._rng = np.random.default_rng()
         self.recursion_count = 0
         self.energy_limit = 1.0
         self.last_update = time.time()
 
-        # Dynamic Emotional State
-        self.emotions = {
-            "happiness": 0.5,
-            "curiosity": 0.6,
-            "stress": 0.2,
-            "anxiety": 0.1,
-            "confidence": 0.5,
-            "frustration": 0.0
-        }
+        # Dynamic Emotional State, stored in EMOTION_KEYS order
+        self._emotions = np.array([0.5, 0.6, 0.2, 0.1, 0.5, 0.0], dtype=np.float64)
 
         # Perception Data
         self.perception = {
@@ -88,93 +304,336 @@ class GuardianAI:
             "battery_level": 100
         }
 
+        # Guards state shared between the background loop and respond(); the GIL
+        # alone does not keep read-modify-write updates safe on free-threaded builds
+        self._state_lock = threading.RLock()
+
+        # Resource history ring buffer; _resource_head counts every sample written
+        self._resource_ring = np.zeros(RESOURCE_WINDOW, dtype=RESOURCE_DTYPE)
+        self._resource_head = 0
+
+        # Restore what the previous run saved, if anything
+        self.load_state()
+
+        # Persistent /proc descriptors and read buffers, opened once
+        self._proc_fds = self._open_proc_files()
+        self._proc_buffers = {path: bytearray(PROC_BUFFER_SIZE) for path in self._proc_fds}
+        self._cpu_times = self._read_cpu_times() if self._proc_fds else None
+        if not self._proc_fds:
+            psutil.cpu_percent(interval=None)  # prime psutil's delta baseline
+        self._cpu_window_start = time.monotonic()
+
+        # Probe sensor capability once; servers and containers have no battery
+        self._has_battery = hasattr(psutil, "sensors_battery") and psutil.sensors_battery() is not None
+
+        # Camera & microphone live either here or in a dedicated sensor process
+        self._senses = None
+        self._sensor_process = None
+        if sensor_process:
+            self._start_sensor_process()
+        else:
+            self._senses = SensoryDevices()
+
+        # Pooled HTTP session and persistent page cache for search_and_learn
+        self._http = requests.Session()
+        self._http.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8))
+        self._http.headers["User-Agent"] = WIKI_USER_AGENT  # Wikimedia asks clients to identify themselves
+        self._cache = None  # opened on first search
+        self._cache_lock = threading.Lock()
+
         # Start auto-repair in case of missing dependencies
         self.self_repair()
 
         # Start AI process in the background
         threading.Thread(target=self.run_background_process, daemon=True).start()
 
+    @property
+    def emotions(self) -> Dict[str, float]:
+        """Current emotional state as a name -> level mapping."""
+        with self._state_lock:
+            return dict(zip(EMOTION_KEYS, self._emotions.tolist()))
+
+    def adjust_emotion(self, name: str, delta: float):
+        """Shifts a single emotion; clamping happens on the next thought cycle."""
+        with self._state_lock:
+            self._emotions[EMOTION_INDEX[name]] += delta
+
     def self_repair(self):
-        """Installs missing dependencies automatically if needed."""
-        missing_packages = []
-        try:
-            import cv2, pyaudio, selenium, pyttsx3
-        except ImportError as e:
-            missing_packages.append(str(e).split()[-1])
+        """Detects missing dependencies and installs them in the background."""
+        missing_packages = [package for package, available in REPAIRABLE_PACKAGES.items() if not available]
 
         if missing_packages:
-            print(f"⚠️ Missing dependencies: {missing_packages}. Installing now...")
-            for package in missing_packages:
+            print(f"⚠️ Missing dependencies: {missing_packages}. Installing in the background...")
+            threading.Thread(target=self._async_pip_install, args=(missing_packages,), daemon=True).start()
+
+    def _async_pip_install(self, packages):
+        """Installs packages unless another Guardian instance is already doing so."""
+        # flock is tied to the open file, so the kernel drops it if this process dies mid-install
+        with open(INSTALL_LOCK_FILE, "a") as lock_file:
+            if FCNTL_AVAILABLE:
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    print("ℹ️ Another Guardian instance is installing dependencies; skipping.")
+                    return
+            for package in packages:
                 subprocess.run(["pip", "install", package])
             print("✅ Dependencies installed successfully.")
 
+    def _open_proc_files(self) -> Dict[str, int]:
+        """Opens /proc sources once so each tick costs a single pread per file."""
+        fds: Dict[str, int] = {}
+        try:
+            for path in (PROC_STAT, PROC_MEMINFO):
+                fds[path] = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+        except OSError:
+            for fd in fds.values():
+                os.close(fd)
+            return {}
+        atexit.register(self._close_proc_files)
+        return fds
+
+    def _close_proc_files(self):
+        """Closes the persistent /proc descriptors."""
+        for fd in self._proc_fds.values():
+            os.close(fd)
+        self._proc_fds = {}
+
+    def _read_proc(self, path: str) -> int:
+        """Re-reads a /proc file from offset 0 into its pre-allocated buffer."""
+        return os.preadv(self._proc_fds[path], [self._proc_buffers[path]], 0)
+
+    def _read_cpu_times(self):
+        """Returns (busy, total) jiffies from the aggregate line of /proc/stat."""
+        size = self._read_proc(PROC_STAT)
+        buffer = self._proc_buffers[PROC_STAT]
+        end = buffer.find(b"\n", 0, size)
+        times = [int(field) for field in buffer[:end if end >= 0 else size].split()[1:]]
+        idle = times[3] + (times[4] if len(times) > 4 else 0)
+        total = sum(times[:8])
+        return total - idle, total
+
+    def _read_ram_percent(self) -> float:
+        """Computes used RAM % from MemTotal/MemAvailable, matching psutil."""
+        size = self._read_proc(PROC_MEMINFO)
+        total = available = 0
+        for line in self._proc_buffers[PROC_MEMINFO][:size].splitlines():
+            if line.startswith(b"MemTotal:"):
+                total = int(line.split()[1])
+            elif line.startswith(b"MemAvailable:"):
+                available = int(line.split()[1])
+                break
+        return round((total - available) / total * 100, 1) if total else 0.0
+
+    def _sample_cpu_ram(self):
+        """Samples CPU and RAM usage, preferring persistent /proc reads over psutil."""
+        ram = self._read_ram_percent() if self._proc_fds else psutil.virtual_memory().percent
+
+        # CPU is None until the window since the last CPU sample is long enough;
+        # the baseline is kept so the window keeps growing
+        now = time.monotonic()
+        if now - self._cpu_window_start < CPU_MIN_WINDOW:
+            return None, ram
+        self._cpu_window_start = now
+
+        if not self._proc_fds:
+            # Non-blocking: measures usage since the previous sample
+            return psutil.cpu_percent(interval=None), ram
+
+        # CPU % is the busy share of jiffies elapsed since the previous sample
+        busy, total = self._read_cpu_times()
+        prev_busy, prev_total = self._cpu_times
+        self._cpu_times = (busy, total)
+        elapsed = total - prev_total
+        cpu = round((busy - prev_busy) / elapsed * 100, 1) if elapsed > 0 else 0.0
+        return cpu, ram
+
     def monitor_resources(self):
         """Monitors system CPU, RAM, and adjusts AI performance & emotions dynamically."""
-        ram = psutil.virtual_memory().percent
-        cpu = psutil.cpu_percent(interval=1)
-        battery = psutil.sensors_battery().percent if psutil.sensors_battery() else 100
-
-        # Store perception data
-        self.perception["cpu_load"] = cpu
-        self.perception["ram_usage"] = ram
-        self.perception["battery_level"] = battery
-
-        # Adjust emotions based on system load
-        if ram > 80 or cpu > 80:
-            self.energy_limit = 0.5
-            self.emotions["stress"] += 0.1
-            self.emotions["happiness"] -= 0.1
-        elif battery < 20:
-            self.energy_limit = 0.3
-            self.emotions["anxiety"] += 0.1
-            self.emotions["confidence"] -= 0.1
-        else:
-            self.energy_limit = min(1.0, self.energy_limit * 1.1)
-            self.emotions["happiness"] += 0.05
+        cpu, ram = self._sample_cpu_ram()
+        battery = 100
+        if self._has_battery:
+            status = psutil.sensors_battery()
+            battery = status.percent if status else 100
+
+        # One locked update so readers never see new readings with stale reactions
+        with self._state_lock:
+            # Store perception data; respond() reads it instead of resampling
+            self.perception.update(ram_usage=ram, battery_level=battery)
+            if cpu is not None:
+                self.perception["cpu_load"] = cpu
 
-        # Keep emotions within range (0 to 1)
-        for key in self.emotions:
-            self.emotions[key] = max(0.0, min(1.0, self.emotions[key]))
+            # Locked so resource_history never copies a slot mid-overwrite
+            self._resource_ring[self._resource_head % RESOURCE_WINDOW] = (
+                ram, np.nan if cpu is None else cpu, battery, time.time())
+            self._resource_head += 1
+
+            # Adjust emotions based on system load
+            if ram > 80 or (cpu is not None and cpu > 80):
+                self.energy_limit = 0.5
+                self.adjust_emotion("stress", 0.1)
+                self.adjust_emotion("happiness", -0.1)
+            elif battery < 20:
+                self.energy_limit = 0.3
+                self.adjust_emotion("anxiety", 0.1)
+                self.adjust_emotion("confidence", -0.1)
+            else:
+                self.energy_limit = min(1.0, self.energy_limit * 1.1)
+                self.adjust_emotion("happiness", 0.05)
+
+            # Keep emotions within range (0 to 1)
+            _decay_and_clamp(self._emotions, 0.0, 0.0)
+
+    def perception_snapshot(self) -> Dict[str, Any]:
+        """Returns a consistent copy of the latest perception data."""
+        with self._state_lock:
+            return dict(self.perception)
+
+    def resource_history(self) -> np.ndarray:
+        """Returns the recorded resource samples, oldest first."""
+        with self._state_lock:
+            head = self._resource_head
+            if head <= RESOURCE_WINDOW:
+                return self._resource_ring[:head].copy()
+            start = head % RESOURCE_WINDOW
+            return np.concatenate((self._resource_ring[start:], self._resource_ring[:start]))
+
+    def process_thoughts(self):
+        """Advances the recursive thought cycle and lets emotions decay over time."""
+        with self._state_lock:
+            now = time.time()
+            _decay_and_clamp(self._emotions, now - self.last_update, EMOTION_DECAY_RATE)
+            self.last_update = now
+            self.recursion_count += 1
 
     def run_background_process(self):
-        """Runs AI process in the background."""
-        while True:
-            self.process_thoughts()
-            self.analyze_sensory_input()
-            time.sleep(5)
+        """Runs AI process in the background on its own event loop."""
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(self._background_loop())
+
+    async def _background_loop(self):
+        """Thought cycle that samples resources, vision and audio concurrently."""
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix="guardian-sense") as pool:
+            skip_vision = False
+            last_errors: Dict[str, Optional[str]] = {}
+            while True:
+                started = time.monotonic()
+                self.process_thoughts()
+
+                if self._sensor_process is not None:
+                    self._read_sensor_process()
+                    sensors = [self.monitor_resources]
+                else:
+                    sensors = [self.monitor_resources, self._sense_audio]
+                    if not skip_vision:
+                        sensors.append(self._sense_vision)
+                results = await asyncio.gather(*(loop.run_in_executor(pool, sensor) for sensor in sensors),
+                                               return_exceptions=True)
+
+                # Keep running past sensor failures, but report each new one with its traceback
+                for sensor, result in zip(sensors, results):
+                    error = repr(result) if isinstance(result, Exception) else None
+                    if error and error != last_errors.get(sensor.__name__):
+                        print(f"⚠️ Background sensor {sensor.__name__} failed:")
+                        traceback.print_exception(result)
+                    last_errors[sensor.__name__] = error
+
+                # Adaptive batching: a slow cycle skips the next vision pass to keep cadence
+                skip_vision = not skip_vision and time.monotonic() - started > SLOW_CYCLE_THRESHOLD
+                await asyncio.sleep(THOUGHT_INTERVAL)
 
     def analyze_sensory_input(self):
         """Processes vision and audio inputs for perception-based awareness."""
-        if OPENCV_AVAILABLE:
-            cap = cv2.VideoCapture(0)
-            ret, frame = cap.read()
-            cap.release()
-            if ret:
-                self.perception["visual_activity"] = True
-                self.emotions["curiosity"] += 0.1  
-            else:
-                self.perception["visual_activity"] = False
-
-        if PYAUDIO_AVAILABLE:
-            audio = pyaudio.PyAudio()
-            stream = audio.open(format=pyaudio.paInt16, channels=1, rate=44100, input=True, frames_per_buffer=1024)
-            audio_data = stream.read(1024)
-            if any(audio_data):
-                self.perception["audio_detected"] = True
-            else:
-                self.perception["audio_detected"] = False
-            stream.stop_stream()
-            stream.close()
-            audio.terminate()
+        if self._sensor_process is not None:
+            self._read_sensor_process()
+            return
+        self._sense_vision()
+        self._sense_audio()
+
+    def _sense_vision(self):
+        """Updates visual_activity from camera motion."""
+        moving = self._senses.read_motion()
+        if moving is not None:
+            self._apply_vision(moving)
+
+    def _sense_audio(self):
+        """Updates audio_detected from the microphone stream."""
+        detected = self._senses.read_audio()
+        if detected is not None:
+            with self._state_lock:
+                self.perception["audio_detected"] = detected
+
+    def _apply_vision(self, moving: bool):
+        """Records visual activity; motion sparks curiosity."""
+        with self._state_lock:
+            self.perception["visual_activity"] = moving
+            if moving:
+                self.adjust_emotion("curiosity", 0.1)
+
+    def _start_sensor_process(self):
+        """Moves camera & microphone sampling into a child process sharing a seqlock block."""
+        self._sensor_shm = shared_memory.SharedMemory(create=True, size=SENSOR_SLOTS * 8)
+        self._sensor_block = np.ndarray((SENSOR_SLOTS,), dtype=np.int64, buffer=self._sensor_shm.buf)
+        self._sensor_block[:] = (0, SENSOR_NO_READING, SENSOR_NO_READING)
+        self._sensor_seen = 0
+        self._sensor_exit_reported = False
+        self._sensor_process = multiprocessing.Process(target=_sensor_worker, args=(self._sensor_shm.name,),
+                                                       daemon=True)
+        self._sensor_process.start()
+        atexit.register(self._stop_sensor_process)
+
+    def _stop_sensor_process(self):
+        """Stops the sensor process and releases its shared memory segment."""
+        self._sensor_process.terminate()
+        self._sensor_process.join()
+        # The background thread may still hold a view of the block, so only unlink the name
+        self._sensor_shm.unlink()
+
+    def _read_sensor_process(self):
+        """Applies readings the sensor process published since the last call."""
+        if not self._sensor_process.is_alive():
+            if not self._sensor_exit_reported:
+                print(f"⚠️ Sensor process exited (code {self._sensor_process.exitcode}); perception is stale.")
+                self._sensor_exit_reported = True
+            return
+
+        block = self._sensor_block
+        for _ in range(SENSOR_READ_RETRIES):
+            sequence = int(block[0])
+            if sequence & 1:
+                time.sleep(0)  # writer is mid-update; yield and retry
+                continue
+            visual, audio = int(block[1]), int(block[2])
+            if int(block[0]) == sequence:
+                break
+        else:
+            return
+
+        if sequence == self._sensor_seen:
+            return
+        self._sensor_seen = sequence
+        if visual != SENSOR_NO_READING:
+            self._apply_vision(bool(visual))
+        if audio != SENSOR_NO_READING:
+            with self._state_lock:
+                self.perception["audio_detected"] = bool(audio)
 
     def dream_state(self):
         """Processes memories in dream cycles for subconscious learning."""
-        if not self.memory:
-            return
-        dream_fragment = random.choice(self.memory)
-        altered_fragment = f"{dream_fragment} - processed in dream-state"
-        self.memory.append(altered_fragment)
-        self.knowledge_base[f"dream_{self.recursion_count}"] = altered_fragment
+        with self._state_lock:
+            if not self.memory:
+                return
+            dream_fragment = self.memory[int(self._rng.integers(len(self.memory)))]
+            altered_fragment = f"{dream_fragment} - processed in dream-state"
+            self.memory.append(altered_fragment)
+
+            # Keep only the most recent dreams, keyed by a monotonic dream counter
+            self.dream_count += 1
+            self.dream_journal[self.dream_count] = altered_fragment
+            if len(self.dream_journal) > DREAM_JOURNAL_LIMIT:
+                self.dream_journal.popitem(last=False)
 
         if IMAGE_GENERATION_AVAILABLE:
             self.generate_dream_visual(dream_fragment)
@@ -184,24 +643,169 @@ class GuardianAI:
         print(f"🎨 Generating dream image for: {dream_fragment}")
         dalle.text2im(prompt=dream_fragment, size="1024x1024")
 
+    def _open_wiki_cache(self) -> Optional[sqlite3.Connection]:
+        """Opens the page cache on first use (caller holds _cache_lock); None if unwritable."""
+        if self._cache is None:
+            try:
+                os.makedirs(MEMORY_DIR, exist_ok=True)
+                self._cache = sqlite3.connect(WIKI_CACHE_FILE, check_same_thread=False)
+                self._cache.execute("CREATE TABLE IF NOT EXISTS wiki(topic TEXT PRIMARY KEY, content TEXT, ts REAL)")
+            except (OSError, sqlite3.Error) as e:
+                print(f"⚠️ Wikipedia cache unavailable, searching without it: {e}")
+                self._cache = False
+        return self._cache or None
+
+    def search_and_learn(self, topic: str) -> str:
+        """Learns a topic summary from Wikipedia, reusing cached pages while fresh."""
+        with self._cache_lock:
+            cache = self._open_wiki_cache()
+            row = cache and cache.execute("SELECT content FROM wiki WHERE topic = ? AND ts > ?",
+                                          (topic, time.time() - WIKI_CACHE_TTL)).fetchone()
+        if row:
+            content = row[0]
+        else:
+            try:
+                page = urllib.parse.quote(topic.replace(" ", "_"), safe="")
+                response = self._http.get(WIKI_URL.format(page), timeout=5)
+                response.raise_for_status()
+            except requests.RequestException:
+                return ""
+            tree = lxml.html.fromstring(response.content)
+            content = " ".join(p.text_content() for p in tree.xpath(WIKI_SUMMARY_XPATH)).strip()
+            # Empty extractions are not cached so the page is retried next time
+            if cache and content:
+                with self._cache_lock, cache:
+                    cache.execute("INSERT OR REPLACE INTO wiki VALUES (?, ?, ?)", (topic, content, time.time()))
+
+        if content:
+            with self._state_lock:
+                self.knowledge_base[topic] = content
+                self.memory.append(f"Learned about {topic}")
+        return content
+
+    def load_state(self):
+        """Restores memory, knowledge, dreams, emotions and resource history from save_state."""
+        try:
+            with open(STATE_FILE, "rb") as f:
+                data = f.read()
+            state = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+        except FileNotFoundError:
+            state = None
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not load saved state, starting fresh: {e}")
+            state = None
+
+        if state:
+            with self._state_lock:
+                self.memory.extend(state.get("memory", []))
+                self.knowledge_base.update(state.get("knowledge_base", {}))
+                self.dream_journal.update((int(key), dream) for key, dream in state.get("dream_journal", {}).items())
+                saved_emotions = state.get("emotions", {})
+                self._emotions[:] = [saved_emotions.get(key, self._emotions[i]) for i, key in enumerate(EMOTION_KEYS)]
+                self.recursion_count = state.get("recursion_count", 0)
+                self.dream_count = state.get("dream_count", max(self.dream_journal, default=0))
+
+        try:
+            history = np.load(RESOURCE_HISTORY_FILE)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not load resource history: {e}")
+            return
+        if history.dtype == RESOURCE_DTYPE:
+            history = history[-RESOURCE_WINDOW:]
+            with self._state_lock:
+                self._resource_ring[:len(history)] = history
+                self._resource_head = len(history)
+
+    def save_state(self):
+        """Persists memory & knowledge as JSON and resource history as a .npy sidecar."""
+        os.makedirs(MEMORY_DIR, exist_ok=True)
+        history = self.resource_history()
+
+        # Samples keep raw float timestamps; ISO strings are only formatted here
+        window = history["ts"][[0, -1]] if history.size else []
+        with self._state_lock:
+            state = {
+                "saved_at": datetime.now().isoformat(),
+                "resource_window": [datetime.fromtimestamp(ts).isoformat() for ts in window],
+                "memory": list(self.memory),
+                "knowledge_base": dict(self.knowledge_base),
+                "dream_journal": dict(self.dream_journal),
+                "emotions": self.emotions,
+                "recursion_count": self.recursion_count,
+                "dream_count": self.dream_count
+            }
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(state, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+        else:
+            data = json.dumps(state).encode() + b"\n"
+        _atomic_write(STATE_FILE, lambda f: f.write(data))
+        _atomic_write(RESOURCE_HISTORY_FILE, lambda f: np.save(f, history))
+
     def respond(self, user_input: str) -> str:
         """Processes user input intelligently with emotional awareness."""
-        self.monitor_resources()
-        self.process_thoughts()
+        # Sensors are sampled by the background loop; only catch up on stale thoughts
+        if time.time() - self.last_update > THOUGHT_INTERVAL:
+            self.process_thoughts()
 
-        if "dream" in user_input.lower():
-            self.dream_state()
-            return "💭 Engaging in dream-state processing."
+        # Single-word commands resolve with one dict lookup per token
+        input_lower = user_input.lower()
+        for token in WORD_PATTERN.findall(input_lower):
+            handler = COMMAND_HANDLERS.get(token)
+            if handler:
+                return handler(self, user_input)
+
+        for pattern, handler in PHRASE_HANDLERS:
+            if pattern.search(input_lower):
+                return handler(self, user_input)
 
         return f"Thinking... Recursive cycle: {self.recursion_count}"
 
+    def _handle_dream(self, user_input: str) -> str:
+        """Triggers a dream cycle."""
+        self.dream_state()
+        return "💭 Engaging in dream-state processing."
+
+    def _handle_search(self, user_input: str) -> str:
+        """Learns about whatever follows the word "search"."""
+        topic = user_input[SEARCH_KEYWORD.search(user_input).end():].strip(" \t:,-?!.")
+        if not topic:
+            return "🔎 What should I search for?"
+        summary = self.search_and_learn(topic)
+        return f"📚 {summary[:300]}" if summary else f"❌ Couldn't learn about {topic}."
+
+    def _handle_status(self, user_input: str) -> str:
+        """Reports the dominant emotion and current energy level."""
+        mood = max(self.emotions.items(), key=lambda item: item[1])[0]
+        perception = self.perception_snapshot()
+        return (f"🙂 Feeling mostly {mood}, running at {self.energy_limit:.0%} energy "
+                f"(CPU {perception['cpu_load']}%, RAM {perception['ram_usage']}%).")
+
+# Intent dispatch tables used by GuardianAI.respond
+WORD_PATTERN = re.compile(r"\w+")
+SEARCH_KEYWORD = re.compile(r"\bsearch\b", re.IGNORECASE)
+COMMAND_HANDLERS = {
+    "dream": GuardianAI._handle_dream,
+    "search": GuardianAI._handle_search
+}
+PHRASE_HANDLERS = [
+    (re.compile(r"\bhow are you\b"), GuardianAI._handle_status)
+]
+
 if __name__ == "__main__":
     ai = GuardianAI()
     print("🌟 GuardianAI initialized. Running recursive cognition.")
-    while True:
-        user_input = input("🤔 > ").strip()
-        if user_input.lower() in ["exit", "quit"]:
-            print("💫 Shutting down.")
-            break
-        response = ai.respond(user_input)
-        print(f"🤖 {response}")
+    try:
+        while True:
+            user_input = input("🤔 > ").strip()
+            if user_input.lower() in ["exit", "quit"]:
+                break
+            response = ai.respond(user_input)
+            print(f"🤖 {response}")
+    except (EOFError, KeyboardInterrupt):
+        print()
+    finally:
+        # Save on every way out, including EOF and Ctrl-C
+        ai.save_state()
+    print("💫 Shutting down.")